@@ -1,6 +1,113 @@
 import pygame
+from functools import lru_cache
 from loguru import logger
-from typing import Tuple, List
+from typing import Dict, FrozenSet, Tuple, List
+
+# (row, col) steps of a chess knight, in the order moves are explored
+_KNIGHT_OFFSETS = (
+    (2, 1), (2, -1), (-2, 1), (-2, -1),
+    (1, 2), (1, -2), (-1, 2), (-1, -2),
+)
+# Same steps as a set, for constant-time "is this a knight move" checks
+_KNIGHT_DELTAS = frozenset(_KNIGHT_OFFSETS)
+
+
+def _warnsdorff_tour(adj: List[Tuple[int, ...]], start: int) -> int:
+    """Walk a knight's tour from start using Warnsdorff's rule.
+
+    Args:
+        adj: Knight neighbours of each flat cell index
+        start: Flat index of the starting cell
+
+    Returns:
+        int: Number of cells visited, including the start
+    """
+    visited = 1 << start  # Bitmask with one bit per cell
+    count = 1
+    pos = start
+    while True:
+        # Pick the unvisited neighbour with the fewest onward moves
+        next_pos = -1
+        fewest = 9
+        for n in adj[pos]:
+            if visited & (1 << n):
+                continue
+            onward = 0
+            for m in adj[n]:
+                if not visited & (1 << m):
+                    onward += 1
+            if onward < fewest:
+                next_pos = n
+                fewest = onward
+        if next_pos < 0:
+            break
+        visited |= 1 << next_pos
+        count += 1
+        pos = next_pos
+    return count
+
+
+@lru_cache(maxsize=None)
+def _knight_adjacency(grid_size_y: int, grid_size_x: int) -> Dict[Tuple[int, int], Tuple[Tuple[int, int], ...]]:
+    """Precompute the knight moves available from every cell of a grid.
+
+    Args:
+        grid_size_y: Height of grid
+        grid_size_x: Width of grid
+
+    Returns:
+        Dict mapping each (row, col) to the cells a knight can reach from it
+    """
+    return {
+        (r, c): tuple((r+dr, c+dc) for dr, dc in _KNIGHT_OFFSETS
+                      if 0 <= r+dr < grid_size_y and 0 <= c+dc < grid_size_x)
+        for r in range(grid_size_y)
+        for c in range(grid_size_x)
+    }
+
+
+@lru_cache(maxsize=None)
+def _max_moves_for_shape(grid_size_y: int, grid_size_x: int) -> int:
+    """Find the longest Warnsdorff tour over all starting cells of a grid.
+
+    The result depends only on the grid shape, so it is cached per shape. The
+    search stops early once a tour covers every cell, since nothing beats it.
+
+    Args:
+        grid_size_y: Height of grid
+        grid_size_x: Width of grid
+
+    Returns:
+        int: Maximum number of moves possible following knight's tour rules
+    """
+    # Flat cell indices (row * width + col) keep the tour loop on plain ints;
+    # the adjacency dict is built in row-major order, matching that indexing
+    adj = [
+        tuple(r * grid_size_x + c for r, c in neighbors)
+        for neighbors in _knight_adjacency(grid_size_y, grid_size_x).values()
+    ]
+
+    # Corners and the centre usually complete a full tour, so try them first
+    preferred = dict.fromkeys([
+        (0, 0), (0, grid_size_x - 1), (grid_size_y - 1, 0),
+        (grid_size_y - 1, grid_size_x - 1), (grid_size_y // 2, grid_size_x // 2),
+    ])
+    starts = list(preferred) + [
+        (i, j) for i in range(grid_size_y) for j in range(grid_size_x)
+        if (i, j) not in preferred
+    ]
+
+    # Try from each starting position and return maximum
+    cell_count = grid_size_y * grid_size_x
+    max_moves = 0
+    for i, j in starts:
+        moves = _warnsdorff_tour(adj, i * grid_size_x + j)
+        max_moves = max(max_moves, moves)
+        logger.debug("Starting from ({},{}): {} moves possible", i, j, moves)
+        if max_moves == cell_count:
+            break
+
+    return max_moves
 
 
 class GridGame:
@@ -11,10 +118,27 @@ class GridGame:
         self.cell_size = 60
         self.grid_size_x = 5  # Width of grid
         self.grid_size_y = 10  # Height of grid
+        # Cells are stored in a bytearray, so move numbers must fit in a byte
+        assert self.grid_size_x * self.grid_size_y <= 255, "grid too large for bytearray cells"
         self.width = self.cell_size * self.grid_size_x
         self.height = self.cell_size * self.grid_size_y + 60  # Extra height for text
         self.screen = pygame.display.set_mode((self.width, self.height))
         pygame.display.set_caption("Grid Counter")
+        self.cell_font = pygame.font.Font(None, 36)
+        self.status_font = pygame.font.Font(None, 36)
+        # Rendered move numbers, keyed by value, so each digit is rasterized once
+        self._digit_cache: Dict[int, pygame.Surface] = {}
+        self.clock = pygame.time.Clock()
+        # Static board art, pre-rendered once and blitted each redraw
+        self._bg = self._render_background(None)
+        self._bg_game_over = self._render_background((255, 200, 200))
+        self._highlight_surf = pygame.Surface((self.cell_size - 2, self.cell_size - 2)).convert()
+        self._highlight_surf.fill((200, 255, 200))
+        self._restart_text = self.status_font.render("Press R to restart game", True, (0, 0, 0))
+        # Last rendered game over summary and the values it was rendered for
+        self._hud_key: Tuple[int, int] | None = None
+        self._hud_surf: pygame.Surface | None = None
+        self.adj = _knight_adjacency(self.grid_size_y, self.grid_size_x)
         self.reset_game()
         logger.info(
             "Grid game initialized with {}x{} grid. Maximum possible moves: {}", 
@@ -23,13 +147,16 @@ class GridGame:
 
     def reset_game(self):
         """Reset the game state to initial values."""
-        self.grid: List[List[int]] = [
-            [0 for _ in range(self.grid_size_x)] for _ in range(self.grid_size_y)
-        ]
+        # Flat row-major grid: cell (row, col) lives at row * grid_size_x + col
+        self.grid = bytearray(self.grid_size_x * self.grid_size_y)
         self.counter = 1
         self.last_clicked: Tuple[int, int] | None = None
+        # Empty cells reachable from last_clicked, i.e. the highlighted moves
+        self.valid_set: FrozenSet[Tuple[int, int]] = frozenset()
         self.game_over = False
+        self._dirty = True  # Board needs to be redrawn on the next frame
         # Calculate maximum possible moves using Warnsdorff's algorithm
+        # (memoized per grid shape, so only the first reset pays for it)
         self.max_possible_moves = self.calculate_max_moves()
         logger.info("Game reset to initial state")
 
@@ -39,42 +166,31 @@ class GridGame:
         Returns:
             int: Maximum number of moves possible following knight's tour rules
         """
-        def get_valid_neighbors(pos: Tuple[int, int], visited: set) -> List[Tuple[int, int]]:
-            row, col = pos
-            moves = [
-                (row+2, col+1), (row+2, col-1), (row-2, col+1), (row-2, col-1),
-                (row+1, col+2), (row+1, col-2), (row-1, col+2), (row-1, col-2)
-            ]
-            return [(r,c) for r,c in moves 
-                    if 0 <= r < self.grid_size_y and 0 <= c < self.grid_size_x 
-                    and (r,c) not in visited]
+        return _max_moves_for_shape(self.grid_size_y, self.grid_size_x)
+
+    def _render_background(self, cell_color: Tuple[int, int, int] | None) -> pygame.Surface:
+        """Render the white screen with grid lines into a display-format surface.
         
-        def warnsdorff_tour(start_pos: Tuple[int, int]) -> int:
-            visited = {start_pos}
-            pos = start_pos
+        Args:
+            cell_color: Fill color for every grid cell, or None to leave cells white
             
-            while True:
-                neighbors = get_valid_neighbors(pos, visited)
-                if not neighbors:
-                    break
-                    
-                # Choose neighbor with fewest onward moves (Warnsdorff's rule)
-                next_pos = min(neighbors, 
-                             key=lambda x: len(get_valid_neighbors(x, visited)))
-                visited.add(next_pos)
-                pos = next_pos
-                
-            return len(visited)
-
-        # Try from each starting position and return maximum
-        max_moves = 0
+        Returns:
+            Surface the size of the window, ready to blit
+        """
+        surface = pygame.Surface((self.width, self.height)).convert()
+        surface.fill((255, 255, 255))
         for i in range(self.grid_size_y):
             for j in range(self.grid_size_x):
-                moves = warnsdorff_tour((i,j))
-                max_moves = max(max_moves, moves)
-                logger.debug(f"Starting from ({i},{j}): {moves} moves possible")
-        
-        return max_moves
+                rect = pygame.Rect(
+                    j * self.cell_size,
+                    i * self.cell_size,
+                    self.cell_size,
+                    self.cell_size,
+                )
+                if cell_color is not None:
+                    pygame.draw.rect(surface, cell_color, rect)
+                pygame.draw.rect(surface, (0, 0, 0), rect, 1)
+        return surface
 
     def get_cell_position(self, mouse_pos: Tuple[int, int]) -> Tuple[int, int]:
         """Convert mouse position to grid coordinates.
@@ -108,30 +224,20 @@ class GridGame:
         if self.last_clicked is None:
             return True
         last_row, last_col = self.last_clicked
-        row_diff = abs(row - last_row)
-        col_diff = abs(col - last_col)
-        return ((row_diff == 2 and col_diff == 1) or (row_diff == 1 and col_diff == 2)) and self.grid[row][col] == 0
+        return (row - last_row, col - last_col) in _KNIGHT_DELTAS and self.grid[row * self.grid_size_x + col] == 0
 
     def has_valid_moves(self) -> bool:
         """Check if there are any valid moves remaining.
         
-        Scans entire grid to find empty cells that can be reached with a valid knight's move
-        from the last clicked position.
+        The empty knight moves from the last clicked position are tracked in
+        valid_set, so this is just an emptiness check.
         
         Returns:
             Boolean indicating if any valid moves exist
         """
         if self.last_clicked is None:
             return True
-        last_row, last_col = self.last_clicked
-        for i in range(self.grid_size_y):
-            for j in range(self.grid_size_x):
-                if self.grid[i][j] == 0:
-                    row_diff = abs(i - last_row)
-                    col_diff = abs(j - last_col)
-                    if (row_diff == 2 and col_diff == 1) or (row_diff == 1 and col_diff == 2):
-                        return True
-        return False
+        return bool(self.valid_set)
 
     def run(self):
         """Main game loop.
@@ -146,9 +252,16 @@ class GridGame:
         Game continues until window is closed or no valid moves remain."""
         running = True
         while running:
-            for event in pygame.event.get():
+            if self.game_over and not self._dirty:
+                # Nothing changes until the player acts, so sleep until an event arrives
+                events = [pygame.event.wait()] + pygame.event.get()
+            else:
+                events = pygame.event.get()
+            for event in events:
                 if event.type == pygame.QUIT:
                     running = False
+                elif event.type == pygame.VIDEOEXPOSE:
+                    self._dirty = True  # Window contents were lost, repaint
                 elif event.type == pygame.KEYDOWN:
                     if event.key == pygame.K_r:  # Reset game when R is pressed
                         self.reset_game()
@@ -160,66 +273,77 @@ class GridGame:
                         and 0 <= col < self.grid_size_x
                         and self.is_valid_move(row, col)
                     ):
-                        self.grid[row][col] = self.counter
+                        self.grid[row * self.grid_size_x + col] = self.counter
                         self.counter += 1
                         self.last_clicked = (row, col)
+                        self.valid_set = frozenset(
+                            (r, c) for r, c in self.adj[(row, col)]
+                            if self.grid[r * self.grid_size_x + c] == 0
+                        )
+                        self._dirty = True
                         logger.debug(
-                            f"Cell ({row}, {col}) clicked. Counter: {self.counter}"
+                            "Cell ({}, {}) clicked. Counter: {}", row, col, self.counter
                         )
                         
                         if not self.has_valid_moves():
                             self.game_over = True
+                            self._dirty = True
                             logger.info("Game over! No more valid moves available")
 
-            # Draw grid
-            self.screen.fill((255, 255, 255))
-            for i in range(self.grid_size_y):
-                for j in range(self.grid_size_x):
-                    rect = pygame.Rect(
-                        j * self.cell_size,
-                        i * self.cell_size,
-                        self.cell_size,
-                        self.cell_size,
-                    )
-                    
-                    if self.game_over:
-                        pygame.draw.rect(self.screen, (255, 200, 200), rect)
-                    else:
-                        # Highlight valid knight moves in green
-                        if self.last_clicked is not None:
-                            last_row, last_col = self.last_clicked
-                            row_diff = abs(i - last_row)
-                            col_diff = abs(j - last_col)
-                            if ((row_diff == 2 and col_diff == 1) or (row_diff == 1 and col_diff == 2)) and self.grid[i][j] == 0:
-                                pygame.draw.rect(self.screen, (200, 255, 200), rect)
-                    
-                    pygame.draw.rect(self.screen, (0, 0, 0), rect, 1)
-
-                    # Draw numbers
-                    if self.grid[i][j] != 0:
-                        font = pygame.font.Font(None, 36)
-                        text = font.render(str(self.grid[i][j]), True, (0, 0, 0))
-                        text_rect = text.get_rect(
-                            center=(
-                                j * self.cell_size + self.cell_size // 2,
-                                i * self.cell_size + self.cell_size // 2,
+            # Only redraw when the board state has changed
+            if self._dirty:
+                # Draw grid
+                self.screen.blit(self._bg_game_over if self.game_over else self._bg, (0, 0))
+
+                # Queue highlights and numbers, then blit them in one batched call
+                blits: List[Tuple[pygame.Surface, Tuple[int, int] | pygame.Rect]] = []
+
+                # Highlight valid knight moves in green, inside the cell borders
+                if not self.game_over:
+                    for r, c in self.valid_set:
+                        blits.append((
+                            self._highlight_surf,
+                            (c * self.cell_size + 1, r * self.cell_size + 1),
+                        ))
+
+                for i in range(self.grid_size_y):
+                    for j in range(self.grid_size_x):
+                        # Draw numbers
+                        value = self.grid[i * self.grid_size_x + j]
+                        if value != 0:
+                            text = self._digit_cache.get(value)
+                            if text is None:
+                                text = self.cell_font.render(str(value), True, (0, 0, 0))
+                                self._digit_cache[value] = text
+                            text_rect = text.get_rect(
+                                center=(
+                                    j * self.cell_size + self.cell_size // 2,
+                                    i * self.cell_size + self.cell_size // 2,
+                                )
                             )
-                        )
-                        self.screen.blit(text, text_rect)
+                            blits.append((text, text_rect))
 
-            # Draw game over text or instructions
-            font = pygame.font.Font(None, 36)
-            if self.game_over:
-                moves_text = f"Moves: {self.counter - 1} | Maximum possible: {self.max_possible_moves} | Press R to restart"
-            else:
-                moves_text = "Press R to restart game"
-            text = font.render(moves_text, True, (0, 0, 0))
-            text_rect = text.get_rect(
-                center=(self.width // 2, self.height - 30)
-            )
-            self.screen.blit(text, text_rect)
-
-            pygame.display.flip()
+                self.screen.blits(blits, doreturn=False)
+
+                # Draw game over text or instructions
+                if self.game_over:
+                    hud_key = (self.counter, self.max_possible_moves)
+                    if hud_key != self._hud_key:
+                        moves_text = f"Moves: {self.counter - 1} | Maximum possible: {self.max_possible_moves} | Press R to restart"
+                        self._hud_surf = self.status_font.render(moves_text, True, (0, 0, 0))
+                        self._hud_key = hud_key
+                    text = self._hud_surf
+                else:
+                    text = self._restart_text
+                text_rect = text.get_rect(
+                    center=(self.width // 2, self.height - 30)
+                )
+                self.screen.blit(text, text_rect)
+
+                pygame.display.flip()
+                self._dirty = False
+
+            self.clock.tick(60)
 
         pygame.quit()
 